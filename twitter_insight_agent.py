@@ -6,80 +6,516 @@ Analyzes the last 5 tweets from a Twitter user and generates 3 actionable insigh
 using Twitter API v2 and OpenRouter's AI model.
 """
 
+from __future__ import annotations
+
 import os
 import sys
-import requests
-import tweepy
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import shelve
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
 from dotenv import load_dotenv
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable, NamedTuple
+
+# tweepy and httpx are slow to import, so they are only loaded once an API
+# client is actually needed
+if TYPE_CHECKING:
+    import httpx
+    import tweepy
+
+# orjson is an optional, faster drop-in for encoding and decoding API payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Load environment variables
 load_dotenv()
 
+# Cached tweets are served without an API call for TWEET_CACHE_MIN_TTL seconds,
+# and as a fallback when Twitter rejects requests for up to TWEET_CACHE_MAX_TTL
+TWEET_CACHE_MIN_TTL = 20 * 60
+TWEET_CACHE_MAX_TTL = 12 * 60 * 60
+
+# Username to user lookups are reused for this long, so a renamed or
+# reassigned username is picked up within a day
+USER_CACHE_TTL = 24 * 60 * 60
+
+# Generated insights are reused for identical prompts for up to a week
+INSIGHT_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Twitter's user lookup accepts at most this many usernames per request
+MAX_USERS_PER_LOOKUP = 100
+
+# Upper bound on concurrent Twitter API requests during batch analysis
+TWITTER_MAX_WORKERS = 5
+
+# Analyses are only paced once fewer Twitter requests than this remain in
+# the current rate limit window
+RATE_LIMIT_LOW_WATERMARK = 10
+
+# Tweets shorter than this in total are not sent to the model
+MIN_TWEET_CHARS = 50
+
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# Cheap endpoint used to open the OpenRouter connection ahead of time
+OPENROUTER_WARMUP_URL = "https://openrouter.ai/api/v1/"
+
+TWITTER_API_HOST = "api.twitter.com"
+
+PROMPT_TEMPLATE = """Analyze the following {n} tweets and generate exactly 3 concise, actionable insights. Focus on sentiment, main topics, trends, or notable patterns. Each insight must be unique and specific to the content provided. Format your response as a numbered list (1-3).
+
+Tweets to analyze:
+{body}
+
+Requirements:
+- Each insight should be 1-2 sentences
+- Focus on actionable observations
+- Avoid vague statements
+- Be specific to the tweet content
+- Number each insight (1, 2, 3)"""
+
+# Retry backoff for OpenRouter: exponential from RETRY_BASE_DELAY, capped at
+# RETRY_MAX_DELAY and randomized by +/- RETRY_JITTER so that concurrent
+# analyses don't retry in lockstep
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_JITTER = 0.5
+
+# Connection pool for OpenRouter. Idle connections are kept long enough to
+# outlive the default cooldown between interactive analyses.
+OPENROUTER_MAX_CONNECTIONS = 4
+OPENROUTER_MAX_KEEPALIVE_CONNECTIONS = 2
+OPENROUTER_KEEPALIVE_EXPIRY = 120
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when available. Raises ValueError on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_usernames(usernames: List[str]) -> List[str]:
+    """
+    Clean and de-duplicate usernames, keeping their order.
+    
+    Usernames are case-insensitive, so only the first spelling is kept.
+    
+    Args:
+        usernames: Twitter usernames (with or without @), blanks are dropped
+        
+    Returns:
+        Usernames without the leading @
+    """
+    clean_usernames = {}
+    for username in usernames:
+        clean_username = username.strip().lstrip('@')
+        if clean_username:
+            clean_usernames.setdefault(clean_username.lower(), clean_username)
+    return list(clean_usernames.values())
+
+
+def write_lines(lines: List[str]) -> None:
+    """Write lines to stdout with a single write call and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds.
+    
+    Args:
+        value: Raw header value, if any
+        
+    Returns:
+        Seconds to wait, or None if missing or not a number (HTTP-date
+        values are not supported)
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def is_empty_event(payload: str) -> bool:
+    """
+    Tell from the raw JSON whether a streamed chat completion event is empty.
+    
+    An event is empty when it has no error, no (or an empty) content delta
+    and no finish_reason. Payloads formatted differently than expected are
+    treated as not empty, so they are decoded rather than lost.
+    
+    Args:
+        payload: Data of a server-sent event
+        
+    Returns:
+        True if the event can be skipped
+    """
+    if '"error"' in payload:
+        return False
+    
+    no_text = ('"content"' not in payload or '"content":""' in payload
+               or '"content":null' in payload)
+    not_finished = '"finish_reason"' not in payload or '"finish_reason":null' in payload
+    return no_text and not_finished
+
+
+def retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Compute how long to wait before retrying a failed request.
+    
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        retry_after: Server's Retry-After hint in seconds, if any
+        
+    Returns:
+        Delay in seconds
+    """
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))
+    delay *= 1 + random.uniform(-RETRY_JITTER, RETRY_JITTER)
+    
+    # The server's hint is a lower bound, but never beyond the usual cap
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, RETRY_MAX_DELAY))
+    
+    return delay
+
+
+class Failure(NamedTuple):
+    """
+    Why fetching tweets failed.
+    
+    The user-facing message is only built when the failure is displayed.
+    """
+    
+    code: str
+    detail: Any = None
+    
+    def __str__(self) -> str:
+        if self.code == 'not_found':
+            return f"User '@{self.detail}' not found. Please check the username and try again."
+        if self.code == 'protected':
+            return f"Account '@{self.detail}' is private/protected. Cannot access tweets."
+        if self.code == 'rate_limit':
+            if self.detail:
+                return f"Twitter API rate limit exceeded. Please wait {self.detail} seconds and try again."
+            return "Twitter API rate limit exceeded. Please wait 15 minutes and try again."
+        if self.code == 'unauthorized':
+            return "Twitter API authentication failed. The Bearer Token needs to be from a Twitter Developer App attached to a Project. Please check your credentials in the Twitter Developer Portal."
+        if self.code == 'forbidden':
+            return "Twitter API access forbidden. The Bearer Token needs to be from a Twitter Developer App attached to a Project. Please check your Twitter Developer Portal settings."
+        return f"Error fetching tweets: {self.detail}"
+
+
+class DiskCache:
+    """Small shelve-backed cache that stores values along with their write time."""
+    
+    def __init__(self, path: str):
+        """
+        Open (or create) a cache file.
+        
+        Args:
+            path: Location of the shelve database, ``~`` is expanded
+        """
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        except OSError:
+            # get and set already fail quietly, so an unusable directory
+            # just leaves the cache empty
+            pass
+    
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        Return the cached value for key if it is younger than max_age seconds.
+        
+        Args:
+            key: Cache key
+            max_age: Maximum entry age in seconds, None for no limit
+            
+        Returns:
+            The cached value, or None on a miss
+        """
+        try:
+            with self._lock, shelve.open(self.path) as db:
+                entry = db.get(key)
+        except Exception:
+            # An unreadable cache is treated as empty
+            return None
+        
+        if entry is None:
+            return None
+        
+        stored_at, value = entry
+        if max_age is not None and time.time() - stored_at > max_age:
+            return None
+        return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value under key, stamped with the current time.
+        
+        Args:
+            key: Cache key
+            value: Any picklable value
+        """
+        try:
+            with self._lock, shelve.open(self.path) as db:
+                db[key] = (time.time(), value)
+        except Exception:
+            # Caching is best effort and must never break an analysis
+            pass
+    
+    def delete(self, key: str) -> None:
+        """
+        Remove the entry for key, if any.
+        
+        Args:
+            key: Cache key
+        """
+        try:
+            with self._lock, shelve.open(self.path) as db:
+                db.pop(key, None)
+        except Exception:
+            pass
+
+
 class TwitterInsightAgent:
     """Main class for Twitter insight analysis."""
     
-    def __init__(self):
-        """Initialize the agent with API credentials."""
+    def __init__(self, use_cache: bool = True):
+        """
+        Initialize the agent with API credentials.
+        
+        Args:
+            use_cache: Whether to keep fetched tweets and insights in the on-disk cache
+        """
         self.bearer_token = os.getenv('TWITTER_BEARER_TOKEN')
         self.openrouter_api_key = os.getenv('OPENROUTER_API_KEY')
         self.openrouter_model = os.getenv('OPENROUTER_MODEL', 'deepseek/deepseek-r1-distill-qwen-7b')
         self.cooldown_seconds = int(os.getenv('COOLDOWN_SECONDS', 60))
+        self.cache_dir = os.getenv('CACHE_DIR', '~/.cache/twitter_insight')
         
         if not self.bearer_token or not self.openrouter_api_key:
             raise ValueError("Missing required API credentials. Please check your .env file.")
         
-        # Initialize Twitter API client
-        self.twitter_client = tweepy.Client(bearer_token=self.bearer_token)
+        # API clients are created on first use
+        self._twitter_client = None
+        self._http_client = None
+        
+        # Rate limit headroom reported by the most recent Twitter response
+        self._rate_limit_remaining = None
+        self._last_twitter_call = 0.0
+        # Created on the event loop thread when first needed
+        self._pace_lock = None
+        
+        # Tweepy is synchronous; batch analyses run its calls on this pool
+        self._twitter_pool = ThreadPoolExecutor(max_workers=TWITTER_MAX_WORKERS)
+        
+        self.tweet_cache = DiskCache(os.path.join(self.cache_dir, 'tweets')) if use_cache else None
+        self.insight_cache = DiskCache(os.path.join(self.cache_dir, 'llm')) if use_cache else None
+        
+        # Event loop and HTTP client shared by all OpenRouter calls so that
+        # pooled connections survive between analyses and retries. The loop
+        # runs on its own thread so connections can be warmed up while the CLI
+        # waits for input; the client is only ever used from that thread.
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+        self._or_headers = {
+            'Authorization': f'Bearer {self.openrouter_api_key}',
+            'Content-Type': 'application/json',
+            'HTTP-Referer': 'https://github.com/twitter-insight-agent',
+            'X-Title': 'Twitter Insight Agent',
+            'User-Agent': 'twitter-insight-agent'
+        }
+    
+    @property
+    def twitter_client(self) -> tweepy.Client:
+        """Twitter API client, created on first use."""
+        if self._twitter_client is None:
+            import tweepy
+            self._twitter_client = tweepy.Client(bearer_token=self.bearer_token)
+            # Tweepy's responses don't expose headers, so read them off the session
+            self._twitter_client.session.hooks['response'].append(self._record_rate_limit)
+        return self._twitter_client
+    
+    def _record_rate_limit(self, response, *args, **kwargs) -> None:
+        """
+        Remember the rate limit headroom reported by a Twitter API response.
+        
+        Args:
+            response: requests.Response returned by the Twitter API
+        """
+        self._last_twitter_call = time.time()
+        remaining = response.headers.get('x-rate-limit-remaining')
+        if remaining is not None:
+            self._rate_limit_remaining = int(remaining)
+    
+    async def _pace_twitter(self) -> None:
+        """
+        Space out Twitter requests when the rate limit is nearly used up.
+        
+        Concurrent analyses take turns, and each one claims its slot before
+        handing over, so their requests end up about a second apart.
+        """
+        if self._pace_lock is None:
+            self._pace_lock = asyncio.Lock()
+        
+        async with self._pace_lock:
+            if self._rate_limit_remaining is None or self._rate_limit_remaining >= RATE_LIMIT_LOW_WATERMARK:
+                return
+            
+            await asyncio.sleep(max(0, 1 - (time.time() - self._last_twitter_call)))
+            self._last_twitter_call = time.time()
+    
+    @property
+    def _http(self) -> httpx.AsyncClient:
+        """OpenRouter HTTP client, created on first use."""
+        if self._http_client is None:
+            import httpx
+            # HTTP/2 compresses the repeated headers and lets retries and
+            # concurrent batch calls share one connection
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                headers=self._or_headers,
+                timeout=30,
+                limits=httpx.Limits(
+                    max_connections=OPENROUTER_MAX_CONNECTIONS,
+                    max_keepalive_connections=OPENROUTER_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=OPENROUTER_KEEPALIVE_EXPIRY
+                )
+            )
+        return self._http_client
+    
+    def _run(self, coro):
+        """Run a coroutine to completion on the agent's event loop."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            # Don't leave the coroutine running after e.g. Ctrl+C
+            future.cancel()
+            raise
+    
+    def close(self) -> None:
+        """Release the HTTP client and event loop."""
+        if self._http_client is not None:
+            self._run(self._http_client.aclose())
+        self._run(self._loop.shutdown_asyncgens())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        self._twitter_pool.shutdown()
+    
+    def warm_connections(self) -> None:
+        """Start opening API connections in the background without waiting."""
+        asyncio.run_coroutine_threadsafe(self._warm_connections(), self._loop)
+    
+    async def _warm_connections(self) -> None:
+        """
+        Open the OpenRouter connection and resolve the Twitter API host.
+        
+        The first analysis then skips the TLS handshake with OpenRouter.
+        Failures are ignored, the real requests will report them.
+        """
+        await asyncio.gather(
+            # Any response, even a 404, leaves a pooled connection behind
+            self._http.head(OPENROUTER_WARMUP_URL),
+            asyncio.get_running_loop().getaddrinfo(TWITTER_API_HOST, 443),
+            return_exceptions=True
+        )
     
-    def get_user_tweets(self, username: str) -> Dict[str, Any]:
+    def get_user_tweets(self, username: str, user_info: Optional[tweepy.User] = None) -> Dict[str, Any]:
         """
         Fetch the last 5 tweets from a Twitter user.
         
         Args:
             username: Twitter username (with or without @)
+            user_info: Already resolved user, skips the user lookup
             
         Returns:
             Dict containing tweets data and metadata
         """
+        import tweepy
+        
+        # Clean username (remove @ if present)
+        clean_username = username.lstrip('@')
+        
+        cached = self._cached_tweets(clean_username, TWEET_CACHE_MIN_TTL)
+        if cached:
+            return cached
+        
         try:
-            # Clean username (remove @ if present)
-            clean_username = username.lstrip('@')
-            
-            # Get user information
-            user_response = self.twitter_client.get_user(username=clean_username)
-            
-            if not user_response.data:
-                return {
-                    'success': False,
-                    'error': f"User '@{clean_username}' not found. Please check the username and try again.",
-                    'tweets': [],
-                    'user_info': None
-                }
-            
-            user_info = user_response.data
-            
-            # Check if account is protected
-            if hasattr(user_info, 'protected') and user_info.protected:
-                return {
-                    'success': False,
-                    'error': f"Account '@{clean_username}' is private/protected. Cannot access tweets.",
-                    'tweets': [],
-                    'user_info': user_info
-                }
+            # Get user information. A given or cached user may be out of date
+            # (account deleted or made protected), so if Twitter rejects the
+            # tweets request for it, the user is looked up again once.
+            if user_info is None:
+                user_info = self._cached_user(clean_username)
+            refreshable = user_info is not None
+            if user_info is None:
+                user_info = self._lookup_user(clean_username)
             
-            # Get user's tweets
-            tweets_response = self.twitter_client.get_users_tweets(
-                id=user_info.id,
-                max_results=5,
-                tweet_fields=['created_at', 'public_metrics']
-            )
+            while True:
+                if not user_info:
+                    return self._not_found(clean_username)
+                
+                # Check if account is protected
+                if user_info.protected:
+                    return {
+                        'success': False,
+                        'error': Failure('protected', clean_username),
+                        'tweets': [],
+                        'user_info': user_info
+                    }
+                
+                # Get user's tweets
+                # Only the text is used, which is returned by default
+                try:
+                    tweets_response = self.twitter_client.get_users_tweets(
+                        id=user_info.id,
+                        max_results=5
+                    )
+                except (tweepy.NotFound, tweepy.Forbidden):
+                    if not refreshable:
+                        raise
+                    tweets_response = None
+                
+                rejected = tweets_response is None or (tweets_response.errors and not tweets_response.data)
+                if not rejected or not refreshable:
+                    break
+                
+                self._forget_user(clean_username)
+                user_info = self._lookup_user(clean_username)
+                refreshable = False
             
             tweets = []
             if tweets_response.data:
                 tweets = [tweet.text for tweet in tweets_response.data]
             
+            # Don't remember an empty timeline Twitter answered with errors
+            if not rejected:
+                self._cache_tweets(clean_username, tweets, user_info)
+            
             return {
                 'success': True,
                 'tweets': tweets,
@@ -88,6 +524,10 @@ class TwitterInsightAgent:
             }
             
         except tweepy.TooManyRequests as e:
+            stale = self._cached_tweets(clean_username, TWEET_CACHE_MAX_TTL)
+            if stale:
+                return stale
+            
             # Extract rate limit reset time if available
             reset_time = None
             if hasattr(e, 'response') and e.response is not None:
@@ -95,135 +535,432 @@ class TwitterInsightAgent:
                 if reset_time:
                     reset_time = int(reset_time)
             
-            error_msg = "Twitter API rate limit exceeded. Please wait 15 minutes and try again."
+            wait_time = None
             if reset_time:
                 current_time = int(time.time())
-                wait_time = reset_time - current_time
-                if wait_time > 0:
-                    error_msg = f"Twitter API rate limit exceeded. Please wait {wait_time} seconds and try again."
+                if reset_time > current_time:
+                    wait_time = reset_time - current_time
             
             return {
                 'success': False,
-                'error': error_msg,
+                'error': Failure('rate_limit', wait_time),
                 'tweets': [],
                 'user_info': None
             }
         except tweepy.Unauthorized:
             return {
                 'success': False,
-                'error': "Twitter API authentication failed. The Bearer Token needs to be from a Twitter Developer App attached to a Project. Please check your credentials in the Twitter Developer Portal.",
+                'error': Failure('unauthorized'),
                 'tweets': [],
                 'user_info': None
             }
         except tweepy.Forbidden:
+            stale = self._cached_tweets(clean_username, TWEET_CACHE_MAX_TTL)
+            if stale:
+                return stale
+            
             return {
                 'success': False,
-                'error': "Twitter API access forbidden. The Bearer Token needs to be from a Twitter Developer App attached to a Project. Please check your Twitter Developer Portal settings.",
+                'error': Failure('forbidden'),
                 'tweets': [],
                 'user_info': None
             }
         except Exception as e:
             return {
                 'success': False,
-                'error': f"Error fetching tweets: {str(e)}",
+                # Drop the traceback so a stored failure doesn't keep frames alive
+                'error': Failure('error', e.with_traceback(None)),
                 'tweets': [],
                 'user_info': None
             }
     
-    def generate_insights(self, tweets: List[str], tweet_count: int) -> str:
+    @staticmethod
+    def _not_found(clean_username: str) -> Dict[str, Any]:
+        """
+        Build the get_user_tweets result for an account that doesn't exist.
+        
+        Args:
+            clean_username: Twitter username without the leading @
+            
+        Returns:
+            A failed get_user_tweets result dict
+        """
+        return {
+            'success': False,
+            'error': Failure('not_found', clean_username),
+            'tweets': [],
+            'user_info': None
+        }
+    
+    def _lookup_user(self, clean_username: str) -> Optional[tweepy.User]:
+        """
+        Resolve a username to a user object with the Twitter API.
+        
+        Public accounts are remembered for USER_CACHE_TTL, so repeat analyses
+        only need the tweets request. Protected accounts are never remembered
+        in case they have been made public since.
+        
+        Args:
+            clean_username: Twitter username without the leading @
+            
+        Returns:
+            The user, or None if no such account exists
+        """
+        user_response = self.twitter_client.get_user(
+            username=clean_username,
+            user_fields=['protected']
+        )
+        
+        user_info = user_response.data
+        if user_info:
+            self._cache_user(user_info)
+        
+        return user_info
+    
+    def _lookup_users(self, clean_usernames: List[str]) -> Dict[str, Optional[tweepy.User]]:
+        """
+        Resolve many usernames with as few user lookups as possible.
+        
+        Users with cached tweets or a cached lookup are skipped; the rest are
+        resolved in batches of up to 100 usernames per request.
+        
+        Args:
+            clean_usernames: Twitter usernames without the leading @
+            
+        Returns:
+            Mapping of lower-cased username to user for every account found,
+            or to None for accounts the lookup reported as not existing.
+            Usernames that weren't looked up are left out.
+        """
+        users = {}
+        missing = []
+        for clean_username in clean_usernames:
+            if self._cached_tweets(clean_username, TWEET_CACHE_MIN_TTL):
+                continue
+            
+            user_info = self._cached_user(clean_username)
+            if user_info is not None:
+                users[clean_username.lower()] = user_info
+            else:
+                missing.append(clean_username)
+        
+        for start in range(0, len(missing), MAX_USERS_PER_LOOKUP):
+            try:
+                users_response = self.twitter_client.get_users(
+                    usernames=missing[start:start + MAX_USERS_PER_LOOKUP],
+                    user_fields=['protected']
+                )
+            except Exception:
+                # Leave the remaining users to the per-user lookup, which
+                # reports the error for each of them
+                break
+            
+            found = set()
+            for user_info in users_response.data or []:
+                self._cache_user(user_info)
+                users[user_info.username.lower()] = user_info
+                found.add(user_info.username.lower())
+            
+            # Usernames missing from a successful response don't exist
+            for clean_username in missing[start:start + MAX_USERS_PER_LOOKUP]:
+                if clean_username.lower() not in found:
+                    users[clean_username.lower()] = None
+        
+        return users
+    
+    def _cached_user(self, clean_username: str) -> Optional[tweepy.User]:
+        """
+        Look up a previously resolved user.
+        
+        Args:
+            clean_username: Twitter username without the leading @
+            
+        Returns:
+            The user, or None on a cache miss
+        """
+        if self.tweet_cache is None:
+            return None
+        
+        user_data = self.tweet_cache.get(f"user:{clean_username.lower()}", USER_CACHE_TTL)
+        if user_data is None:
+            return None
+        
+        import tweepy
+        return tweepy.User(user_data)
+    
+    def _cache_user(self, user_info: tweepy.User) -> None:
+        """
+        Remember a resolved user, unless the account is protected.
+        
+        Args:
+            user_info: User object returned by the Twitter API
+        """
+        if self.tweet_cache is None or user_info.protected:
+            return
+        
+        self.tweet_cache.set(f"user:{user_info.username.lower()}", user_info.data)
+    
+    def _forget_user(self, clean_username: str) -> None:
+        """
+        Drop a remembered user that no longer matches the account.
+        
+        Args:
+            clean_username: Twitter username without the leading @
+        """
+        if self.tweet_cache is not None:
+            self.tweet_cache.delete(f"user:{clean_username.lower()}")
+    
+    def _cached_tweets(self, clean_username: str, max_age: float) -> Optional[Dict[str, Any]]:
+        """
+        Look up previously fetched tweets for a user.
+        
+        Args:
+            clean_username: Twitter username without the leading @
+            max_age: Maximum age of the cached entry in seconds
+            
+        Returns:
+            A get_user_tweets result dict, or None on a cache miss
+        """
+        if self.tweet_cache is None:
+            return None
+        
+        entry = self.tweet_cache.get(f"tweets:{clean_username.lower()}", max_age)
+        if entry is None:
+            return None
+        
+        import tweepy
+        
+        tweets, user_data = entry
+        return {
+            'success': True,
+            'tweets': tweets,
+            'user_info': tweepy.User(user_data),
+            'tweet_count': len(tweets),
+            'cached': True
+        }
+    
+    def _cache_tweets(self, clean_username: str, tweets: List[str], user_info: tweepy.User) -> None:
+        """
+        Store freshly fetched tweets for a user.
+        
+        Args:
+            clean_username: Twitter username without the leading @
+            tweets: Tweet texts
+            user_info: User object returned by the Twitter API
+        """
+        if self.tweet_cache is None:
+            return
+        
+        # Tweepy models don't pickle cleanly, so keep the raw user payload
+        self.tweet_cache.set(
+            f"tweets:{clean_username.lower()}",
+            (tweets, user_info.data)
+        )
+    
+    async def get_user_tweets_async(self, username: str, user_info: Optional[tweepy.User] = None) -> Dict[str, Any]:
+        """
+        Fetch tweets without blocking the event loop.
+        
+        Tweepy's client is synchronous, so the lookup runs on the Twitter
+        thread pool while other analyses proceed.
+        
+        Args:
+            username: Twitter username (with or without @)
+            user_info: Already resolved user, skips the user lookup
+            
+        Returns:
+            Dict containing tweets data and metadata
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._twitter_pool, self.get_user_tweets, username, user_info)
+    
+    async def generate_insights(
+        self,
+        tweets: List[str],
+        tweet_count: int,
+        on_text: Optional[Callable[[str], None]] = None
+    ) -> str:
         """
         Generate insights using OpenRouter API.
         
+        The response is streamed; on_text receives each piece of the insights
+        as soon as it arrives. Errors before any text was streamed are only
+        returned; errors afterwards end the streamed text with a note that
+        the answer was cut off. Only complete answers are cached.
+        
         Args:
             tweets: List of tweet texts
             tweet_count: Number of tweets available
+            on_text: Optional callback for incremental insight text
             
         Returns:
             Generated insights as formatted string
         """
+        import httpx
+        
         if not tweets:
             return "No tweets available for analysis."
         
+        # Too little text to say anything meaningful, don't spend an LLM call
+        if sum(len(tweet) for tweet in tweets) < MIN_TWEET_CHARS:
+            return "Not enough tweet content to generate meaningful insights."
+        
         # Prepare tweets text
-        tweets_text = "\n".join([f"Tweet {i+1}: {tweet}" for i, tweet in enumerate(tweets)])
+        tweets_text = "\n".join(f"Tweet {n}: {tweet}" for n, tweet in enumerate(tweets, 1))
         
         # Construct prompt
-        prompt = f"""Analyze the following {tweet_count} tweets and generate exactly 3 concise, actionable insights. Focus on sentiment, main topics, trends, or notable patterns. Each insight must be unique and specific to the content provided. Format your response as a numbered list (1-3).
-
-Tweets to analyze:
-{tweets_text}
-
-Requirements:
-- Each insight should be 1-2 sentences
-- Focus on actionable observations
-- Avoid vague statements
-- Be specific to the tweet content
-- Number each insight (1, 2, 3)"""
+        prompt = PROMPT_TEMPLATE.format(n=tweet_count, body=tweets_text)
+        
+        # Identical tweets produce an identical prompt, so a cached answer
+        # for the same prompt and model can be reused as is
+        cache_key = hashlib.sha256(f"{self.openrouter_model}\n{prompt}".encode()).hexdigest()
+        if self.insight_cache is not None:
+            cached = self.insight_cache.get(cache_key, INSIGHT_CACHE_TTL)
+            if cached is not None:
+                if on_text is not None:
+                    on_text(cached)
+                return cached
+        
+        data = {
+            'model': self.openrouter_model,
+            'messages': [{'role': 'user', 'content': prompt}],
+            'max_tokens': 300,
+            'temperature': 0.7,
+            'stream': True
+        }
         
         # Retry logic with exponential backoff
         max_retries = 3
-        base_delay = 1
+        
+        def cut_off(parts: List[str], reason: str) -> str:
+            # Text already passed to on_text can't be taken back, so the
+            # answer is ended with a note instead of being retried
+            notice = f"\n\n⚠️  Answer cut off: {reason}"
+            on_text(notice)
+            return "".join(parts).strip() + notice
         
         for attempt in range(max_retries):
+            parts = []
+            streamed = False
             try:
-                headers = {
-                    'Authorization': f'Bearer {self.openrouter_api_key}',
-                    'Content-Type': 'application/json',
-                    'HTTP-Referer': 'https://github.com/twitter-insight-agent',
-                    'X-Title': 'Twitter Insight Agent'
-                }
-                
-                data = {
-                    'model': self.openrouter_model,
-                    'prompt': prompt,
-                    'max_tokens': 300,
-                    'temperature': 0.7
-                }
-                
-                response = requests.post(
-                    'https://openrouter.ai/api/v1/completions',
-                    headers=headers,
-                    json=data,
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    insights = result['choices'][0]['text'].strip()
-                    return insights
-                elif response.status_code == 429:
-                    # Rate limited - wait and retry
-                    if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
-                        print(f"⚠️  Rate limited. Waiting {delay} seconds before retry...")
-                        time.sleep(delay)
-                        continue
+                # Auth and attribution headers are set once on the client
+                async with self._http.stream(
+                    'POST',
+                    OPENROUTER_URL,
+                    content=json_dumps(data)
+                ) as response:
+                    if response.status_code == 200:
+                        finished = False
+                        error = None
+                        
+                        async for line in response.aiter_lines():
+                            # Server-sent events; lines starting with ':' are keep-alive comments
+                            if not line.startswith('data: '):
+                                continue
+                            
+                            payload = line[len('data: '):]
+                            if payload == '[DONE]':
+                                finished = True
+                                break
+                            
+                            # Events without text, completion marker or error
+                            # (role announcement, reasoning, usage) are skipped
+                            # without being decoded
+                            if is_empty_event(payload):
+                                continue
+                            
+                            try:
+                                chunk = json_loads(payload)
+                            except ValueError:
+                                # Ignore a malformed event rather than losing the answer
+                                continue
+                            
+                            if 'error' in chunk:
+                                error = chunk['error']
+                                if isinstance(error, dict):
+                                    error = error.get('message', error)
+                                break
+                            
+                            if not chunk.get('choices'):
+                                continue
+                            
+                            choice = chunk['choices'][0]
+                            if choice.get('finish_reason'):
+                                finished = True
+                            
+                            text = (choice.get('delta') or {}).get('content')
+                            if not parts and text:
+                                text = text.lstrip()
+                            if not text:
+                                continue
+                            
+                            parts.append(text)
+                            if on_text is not None:
+                                on_text(text)
+                                streamed = True
+                        
+                        if error is not None:
+                            if streamed:
+                                return cut_off(parts, str(error))
+                            return f"Error generating insights: {error}"
+                        
+                        if not finished:
+                            # Retried like any other dropped connection
+                            raise httpx.RemoteProtocolError("stream ended before the answer was complete")
+                        
+                        # Only complete answers are cached
+                        insights = "".join(parts).strip()
+                        if insights and self.insight_cache is not None:
+                            self.insight_cache.set(cache_key, insights)
+                        return insights
+                    
+                    await response.aread()
+                    if response.status_code == 429:
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                        
+                        # Rate limited - wait and retry, unless the server asks
+                        # for a longer wait than we are willing to block for
+                        if attempt < max_retries - 1 and (retry_after is None or retry_after <= RETRY_MAX_DELAY):
+                            delay = retry_delay(attempt, retry_after)
+                            print(f"⚠️  Rate limited. Waiting {delay:.1f} seconds before retry...")
+                            await asyncio.sleep(delay)
+                            continue
+                        else:
+                            return "AI service is currently busy. Please try again in a few minutes."
                     else:
-                        return "AI service is currently busy. Please try again in a few minutes."
-                else:
-                    return f"Error generating insights: {response.status_code} - {response.text}"
+                        return f"Error generating insights: {response.status_code} - {response.text}"
                     
-            except requests.exceptions.Timeout:
+            except httpx.TimeoutException:
+                if streamed:
+                    return cut_off(parts, "the request timed out")
                 if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)
-                    print(f"⚠️  Request timed out. Retrying in {delay} seconds...")
-                    time.sleep(delay)
+                    delay = retry_delay(attempt)
+                    print(f"⚠️  Request timed out. Retrying in {delay:.1f} seconds...")
+                    await asyncio.sleep(delay)
                     continue
                 else:
                     return "Request timed out. Please try again."
-            except requests.exceptions.RequestException as e:
+            except httpx.RequestError as e:
+                if streamed:
+                    return cut_off(parts, f"connection error ({e})")
                 if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)
-                    print(f"⚠️  Connection error. Retrying in {delay} seconds...")
-                    time.sleep(delay)
+                    delay = retry_delay(attempt)
+                    print(f"⚠️  Connection error. Retrying in {delay:.1f} seconds...")
+                    await asyncio.sleep(delay)
                     continue
                 else:
                     return f"Error connecting to AI service: {str(e)}"
             except Exception as e:
+                if streamed:
+                    return cut_off(parts, str(e))
                 return f"Error generating insights: {str(e)}"
         
         return "Failed to generate insights after multiple attempts. Please try again later."
     
+    def generate_insights_sync(self, tweets: List[str], tweet_count: int) -> str:
+        """Blocking wrapper around :meth:`generate_insights`."""
+        return self._run(self.generate_insights(tweets, tweet_count))
+    
     def analyze_user(self, username: str) -> None:
         """
         Analyze a Twitter user and display insights.
@@ -231,53 +968,133 @@ Requirements:
         Args:
             username: Twitter username to analyze
         """
-        print(f"\n🔍 Analyzing @{username.lstrip('@')}...")
+        self._run(self._analyze(username, stream=True))
+    
+    def analyze_users(self, usernames: List[str]) -> None:
+        """
+        Analyze several Twitter users concurrently and display insights.
+        
+        All usernames are resolved with a single user lookup before their
+        tweets are fetched in parallel.
+        
+        Args:
+            usernames: Twitter usernames to analyze (with or without @)
+        """
+        clean_usernames = parse_usernames(usernames)
+        users = self._lookup_users(clean_usernames)
+        
+        async def analyze_all():
+            await asyncio.gather(*(
+                self._analyze(
+                    clean_username,
+                    users.get(clean_username.lower()),
+                    not_found=clean_username.lower() in users and users[clean_username.lower()] is None
+                )
+                for clean_username in clean_usernames
+            ))
+        
+        self._run(analyze_all())
+    
+    async def _analyze(
+        self,
+        username: str,
+        user_info: Optional[tweepy.User] = None,
+        stream: bool = False,
+        not_found: bool = False
+    ) -> None:
+        """
+        Fetch tweets for a user, generate insights and print the report.
+        
+        Args:
+            username: Twitter username to analyze
+            user_info: Already resolved user, skips the user lookup
+            stream: Print insights as they are generated; only safe when a
+                single analysis is running
+            not_found: The account is already known not to exist, so no
+                request is made
+        """
+        name = username.lstrip('@')
+        
+        # Output is collected and written in as few writes as possible; the
+        # status lines are flushed before the slow LLM call
+        buf = [f"\n🔍 Analyzing @{name}..."]
         
-        # Add a small delay to prevent rate limiting
-        time.sleep(1)
+        await self._pace_twitter()
         
         # Fetch tweets
-        result = self.get_user_tweets(username)
+        if not_found:
+            result = self._not_found(name)
+        else:
+            result = await self.get_user_tweets_async(username, user_info)
         
         if not result['success']:
-            print(f"❌ {result['error']}")
+            buf.append(f"❌ {result['error']}")
             
             # If it's a rate limit error, suggest waiting
-            if "rate limit" in result['error'].lower():
-                print("💡 Tip: Wait a few minutes before trying again, or try a different username.")
+            if result['error'].code == 'rate_limit':
+                buf.append("💡 Tip: Wait a few minutes before trying again, or try a different username.")
             
+            write_lines(buf)
             return
         
         tweets = result['tweets']
         tweet_count = result['tweet_count']
         
+        if result.get('cached'):
+            buf.append("💾 Using cached tweets (run with --no-cache to always fetch fresh ones)")
+        
         if not tweets:
-            print(f"📭 No tweets found for @{username.lstrip('@')}")
+            buf.append(f"📭 No tweets found for @{name}")
+            write_lines(buf)
             return
         
         # Display tweet count info
         if tweet_count < 5:
-            print(f"📊 Found {tweet_count} tweets (less than 5 available)")
+            buf.append(f"📊 Found {tweet_count} tweets (less than 5 available)")
         else:
-            print("📊 Analyzing last 5 tweets")
+            buf.append("📊 Analyzing last 5 tweets")
         
         # Generate insights
-        print("🤖 Generating insights...")
-        insights = self.generate_insights(tweets, tweet_count)
+        buf.append("🤖 Generating insights...")
+        write_lines(buf)
+        
+        header = [f"\n📈 Insights for @{name}:", "=" * 50]
+        
+        if not stream:
+            insights = await self.generate_insights(tweets, tweet_count)
+            
+            # Display results
+            write_lines(header + [insights, "=" * 50])
+            return
+        
+        streamed = []
         
-        # Display results
-        print(f"\n📈 Insights for @{username.lstrip('@')}:")
-        print("=" * 50)
-        print(insights)
-        print("=" * 50)
+        def show(text: str) -> None:
+            if not streamed:
+                write_lines(header)
+            streamed.append(text)
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        
+        insights = await self.generate_insights(tweets, tweet_count, on_text=show)
+        
+        # Errors are returned without being streamed
+        if streamed:
+            write_lines(["", "=" * 50])
+        else:
+            write_lines(header + [insights, "=" * 50])
     
     def run(self) -> None:
         """Main CLI loop."""
         print("🐦 Twitter Insight Agent")
         print("=" * 30)
         print("Analyze Twitter accounts and get actionable insights!")
+        print("Separate several usernames with commas to analyze them together.")
         print("Type 'quit' or 'exit' to stop.\n")
         
+        # Connect while the user is still typing the first username
+        self.warm_connections()
+        
         while True:
             try:
                 username = input("Enter Twitter username (with or without @): ").strip()
@@ -290,7 +1107,14 @@ Requirements:
                     print("Please enter a valid username.")
                     continue
                 
-                self.analyze_user(username)
+                if ',' in username:
+                    usernames = parse_usernames(username.split(','))
+                    if not usernames:
+                        print("Please enter a valid username.")
+                        continue
+                    self.analyze_users(usernames)
+                else:
+                    self.analyze_user(username)
 
                 # Add a cooldown period to respect API rate limits
                 if self.cooldown_seconds > 0:
@@ -308,9 +1132,16 @@ Requirements:
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Analyze Twitter accounts and get actionable insights.")
+    parser.add_argument('--no-cache', action='store_true', help="ignore cached tweets and insights and always call the APIs")
+    args = parser.parse_args()
+    
     try:
-        agent = TwitterInsightAgent()
-        agent.run()
+        agent = TwitterInsightAgent(use_cache=not args.no_cache)
+        try:
+            agent.run()
+        finally:
+            agent.close()
     except ValueError as e:
         print(f"❌ Configuration Error: {e}")
         print("Please check your .env file and ensure all required API keys are set.")